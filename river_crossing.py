@@ -1,184 +1,223 @@
-from typing import Optional, Dict, List, Set
+from typing import Optional, Dict, FrozenSet, List, Tuple
+from collections import deque
 from dataclasses import dataclass
-from enum import Enum, auto
+import sys
 import time
 
-class Bank(Enum):
-    LEFT = auto()
-    RIGHT = auto()
-    
-    def opposite(self) -> 'Bank':
-        return Bank.RIGHT if self == Bank.LEFT else Bank.LEFT
-    
-    def __str__(self) -> str:
-        return self.name.lower()
+LEFT, RIGHT = 0, 1
+BANK_NAMES = ('left', 'right')
+
+def opposite(bank: int) -> int:
+    """Return the bank across the river from the given one."""
+    return bank ^ 1
+
+# Each bit records which bank one item is on: LEFT or RIGHT
+FARMER, FOX, CHICKEN, GRAIN = 1, 2, 4, 8
+ALL_RIGHT = FARMER | FOX | CHICKEN | GRAIN
+FOX_CHICKEN = FOX | CHICKEN
+CHICKEN_GRAIN = CHICKEN | GRAIN
+
+ITEM_BITS = {'Farmer': FARMER, 'Fox': FOX, 'Chicken': CHICKEN, 'Grain': GRAIN}
+# A move is tagged by the bits it flips; the farmer always crosses
+MOVE_NAMES = {FARMER | bit: item for item, bit in ITEM_BITS.items()}
+
+_VALID_ITEMS = frozenset(('Fox', 'Chicken', 'Grain'))
+
+EMOJI_MAP = {
+    'Farmer': '👨‍🌾',
+    'Fox': '🦊',
+    'Chicken': '🐔',
+    'Grain': '🌾'
+}
+
+def _unattended(state: int) -> int:
+    """Return the bits of the items on the bank opposite the farmer."""
+    return state ^ ALL_RIGHT if state & FARMER else state
+
+def _why_invalid(state: int) -> Optional[str]:
+    """Return what gets eaten on the bank opposite the farmer, if anything."""
+    items_without_farmer = _unattended(state)
+    if items_without_farmer & FOX_CHICKEN == FOX_CHICKEN:
+        return 'fox_ate_chicken'
+    if items_without_farmer & CHICKEN_GRAIN == CHICKEN_GRAIN:
+        return 'chicken_ate_grain'
+    return None
+
+INVALID_MESSAGES = {
+    'fox_ate_chicken': "🦊 The fox ate the chicken! 🐔",
+    'chicken_ate_grain': "🐔 The chicken ate the grain! 🌾",
+}
+
+# The whole 16-state graph is fixed, so it is built once at import
+INVALID_REASONS: Tuple[Optional[str], ...] = tuple(
+    _why_invalid(state) for state in range(ALL_RIGHT + 1)
+)
+VALID: FrozenSet[int] = frozenset(
+    state for state, reason in enumerate(INVALID_REASONS) if reason is None
+)
+
+def _neighbors(state: int) -> Tuple[Tuple[int, int], ...]:
+    """Return the legal (next_state, move) pairs from a valid state."""
+    items_with_farmer = _unattended(state) ^ ALL_RIGHT
+    pairs = []
+    for bit in (FARMER, FOX, CHICKEN, GRAIN):
+        if bit & items_with_farmer:
+            move = FARMER | bit
+            next_state = state ^ move
+            if next_state in VALID:
+                pairs.append((next_state, move))
+    return tuple(pairs)
+
+# Legal (next_state, move) pairs, indexed by state
+NEIGHBORS: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+    _neighbors(state) if state in VALID else ()
+    for state in range(ALL_RIGHT + 1)
+)
+
+def _shortest_path(start: int) -> Optional[Tuple[int, ...]]:
+    """Return the fewest moves that take start to ALL_RIGHT, or None."""
+    queue = deque([start])
+    prev: Dict[int, Optional[Tuple[int, int]]] = {start: None}
+    while queue:
+        state = queue.popleft()
+        if state == ALL_RIGHT:
+            break
+        for next_state, move in NEIGHBORS[state]:
+            if next_state not in prev:
+                prev[next_state] = (state, move)
+                queue.append(next_state)
+    else:
+        return None
+
+    path = []
+    link = prev[ALL_RIGHT]
+    while link is not None:
+        state, move = link
+        path.append(move)
+        link = prev[state]
+    return tuple(reversed(path))
+
+# Shortest remaining moves from every state, or None for invalid states
+PATHS: Tuple[Optional[Tuple[int, ...]], ...] = tuple(
+    _shortest_path(state) if state in VALID else None
+    for state in range(ALL_RIGHT + 1)
+)
+SOLUTION: Tuple[int, ...] = PATHS[0]
+
+# Item names on the (LEFT, RIGHT) bank, indexed by state
+BANK_ITEMS: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = tuple(
+    (tuple(item for item, bit in ITEM_BITS.items() if not state & bit),
+     tuple(item for item, bit in ITEM_BITS.items() if state & bit))
+    for state in range(ALL_RIGHT + 1)
+)
 
 @dataclass
 class GameState:
-    positions: Dict[str, Bank]
-    history: List[tuple[str, Bank]]
-    
-    def copy(self) -> 'GameState':
-        return GameState(
-            positions=self.positions.copy(),
-            history=self.history.copy()
-        )
+    __slots__ = ('positions', 'history')
+
+    positions: int
+    history: List[int]
 
 class RiverCrossingGame:
     def __init__(self):
         """Initialize the game with all items on the left bank."""
         self.state = GameState(
-            positions={
-                'Farmer': Bank.LEFT,
-                'Fox': Bank.LEFT,
-                'Chicken': Bank.LEFT,
-                'Grain': Bank.LEFT
-            },
+            positions=0,
             history=[]
         )
         self.move_count = 0
-        self._cached_solutions: Optional[Set[tuple[str, Bank]]] = None
 
-    def get_items_at_bank(self, bank: Bank) -> List[str]:
+    def get_items_at_bank(self, bank: int) -> List[str]:
         """Get all items at the specified bank."""
-        return [item for item, pos in self.state.positions.items() if pos == bank]
+        return list(BANK_ITEMS[self.state.positions][bank])
 
     def is_valid_state(self) -> bool:
         """Check if the current state is valid based on game rules."""
-        farmer_bank = self.state.positions['Farmer']
-        
-        # Check dangerous combinations on the bank opposite to farmer
-        opposite_bank = farmer_bank.opposite()
-        items_without_farmer = self.get_items_at_bank(opposite_bank)
-        
-        if 'Fox' in items_without_farmer and 'Chicken' in items_without_farmer:
-            print("\n🦊 The fox ate the chicken! 🐔")
-            return False
-            
-        if 'Chicken' in items_without_farmer and 'Grain' in items_without_farmer:
-            print("\n🐔 The chicken ate the grain! 🌾")
-            return False
-            
-        return True
+        return self.state.positions in VALID
 
     def is_won(self) -> bool:
         """Check if all items have been moved to the right bank."""
-        return all(pos == Bank.RIGHT for pos in self.state.positions.values())
+        return self.state.positions == ALL_RIGHT
 
     def make_move(self, item: Optional[str]) -> bool:
         """
         Attempt to move the farmer and optionally one item.
         Returns True if the move was valid and successful.
         """
-        if item and item not in self.state.positions:
+        if item and item not in ITEM_BITS:
             print(f"\n❌ Invalid item: {item}")
             return False
 
-        current_bank = self.state.positions['Farmer']
-        if item and self.state.positions[item] != current_bank:
+        if item and ITEM_BITS[item] & _unattended(self.state.positions):
             print(f"\n❌ Cannot move {item} - not on same bank as farmer")
             return False
 
         # Make the move
-        next_bank = current_bank.opposite()
-        self.state.positions['Farmer'] = next_bank
-        if item:
-            self.state.positions[item] = next_bank
-            self.state.history.append((item, next_bank))
-        else:
-            self.state.history.append(('Farmer', next_bank))
+        move = FARMER | ITEM_BITS[item] if item else FARMER
+        self.state.positions ^= move
+        self.state.history.append(move)
             
         self.move_count += 1
         return True
 
     def display_state(self):
         """Display the current game state with ASCII art."""
-        left_items = self.get_items_at_bank(Bank.LEFT)
-        right_items = self.get_items_at_bank(Bank.RIGHT)
+        left_items = self.get_items_at_bank(LEFT)
+        right_items = self.get_items_at_bank(RIGHT)
         
         print("\n" + "=" * 60)
         print(f"Move {self.move_count}")
         print("-" * 60)
         
         # Display items with emoji
-        emoji_map = {
-            'Farmer': '👨‍🌾',
-            'Fox': '🦊',
-            'Chicken': '🐔',
-            'Grain': '🌾'
-        }
-        
-        left_str = ' '.join(emoji_map[item] for item in left_items)
-        right_str = ' '.join(emoji_map[item] for item in right_items)
+        left_str = ' '.join(EMOJI_MAP[item] for item in left_items)
+        right_str = ' '.join(EMOJI_MAP[item] for item in right_items)
         
         print(f"Left bank:  {left_str}")
         print("          ~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
         print(f"Right bank: {right_str}")
         print("=" * 60)
 
-    def solve(self) -> Optional[List[tuple[str, Bank]]]:
-        """Find a solution using depth-first search."""
-        if self._cached_solutions:
-            return list(self._cached_solutions)
+    def solve(self) -> Optional[List[int]]:
+        """Look up the shortest solution from the precomputed paths."""
+        path = PATHS[self.state.positions]
+        if path is None:
+            return None
+        return self.state.history + list(path)
 
-        def dfs(state: GameState, visited: Set[frozenset]) -> Optional[List[tuple[str, Bank]]]:
-            if all(pos == Bank.RIGHT for pos in state.positions.values()):
-                return state.history
+    @staticmethod
+    def _is_valid_state(state: int) -> bool:
+        """Helper method to check if a bitmask represents a valid state."""
+        return state in VALID
 
-            # Create a frozen set of current positions for visited checking
-            state_key = frozenset((item, pos) for item, pos in state.positions.items())
-            if state_key in visited:
-                return None
-            visited.add(state_key)
+    def _quit(self) -> bool:
+        """Say goodbye and end the game."""
+        print("\n👋 Thanks for playing!")
+        return True
 
-            farmer_bank = state.positions['Farmer']
-            items_with_farmer = [item for item, pos in state.positions.items() 
-                               if pos == farmer_bank and item != 'Farmer']
-            
-            # Try moving farmer alone
-            next_state = state.copy()
-            next_state.positions['Farmer'] = farmer_bank.opposite()
-            next_state.history.append(('Farmer', farmer_bank.opposite()))
-            
-            # Check if next state is valid
-            if self._is_valid_state(next_state.positions):
-                result = dfs(next_state, visited)
-                if result:
-                    return result
-
-            # Try moving farmer with each possible item
-            for item in items_with_farmer:
-                next_state = state.copy()
-                next_state.positions['Farmer'] = farmer_bank.opposite()
-                next_state.positions[item] = farmer_bank.opposite()
-                next_state.history.append((item, farmer_bank.opposite()))
-                
-                if self._is_valid_state(next_state.positions):
-                    result = dfs(next_state, visited)
-                    if result:
-                        return result
-            
-            return None
+    def _show_help(self) -> bool:
+        """Print the list of commands."""
+        print("\nCommands:")
+        print("- fox, chicken, grain: move with item")
+        print("- none: move farmer alone")
+        print("- hint: get a hint")
+        print("- quit: exit game")
+        return False
 
-        solution = dfs(self.state, set())
+    def _show_hint(self) -> bool:
+        """Suggest the next move along the shortest solution."""
+        solution = self.solve()
         if solution:
-            self._cached_solutions = set(solution)
-        return solution
+            next_move = solution[len(self.state.history)]
+            print(f"\n💡 Hint: Consider moving the {MOVE_NAMES[next_move].lower()}")
+        return False
 
-    @staticmethod
-    def _is_valid_state(positions: Dict[str, Bank]) -> bool:
-        """Helper method to check if a position dictionary represents a valid state."""
-        farmer_bank = positions['Farmer']
-        opposite_bank = Bank.RIGHT if farmer_bank == Bank.LEFT else Bank.LEFT
-        
-        items_without_farmer = [item for item, pos in positions.items() 
-                              if pos == opposite_bank and item != 'Farmer']
-        
-        if 'Fox' in items_without_farmer and 'Chicken' in items_without_farmer:
-            return False
-        if 'Chicken' in items_without_farmer and 'Grain' in items_without_farmer:
-            return False
-        return True
+    # Non-move commands; each handler returns True when the game should end
+    _COMMANDS = {
+        'quit': _quit,
+        'help': _show_help,
+        'hint': _show_hint,
+    }
 
     def play(self):
         """Main game loop with interactive gameplay."""
@@ -193,7 +232,9 @@ class RiverCrossingGame:
         while True:
             self.display_state()
             
-            if not self.is_valid_state():
+            reason = INVALID_REASONS[self.state.positions]
+            if reason:
+                print(f"\n{INVALID_MESSAGES[reason]}")
                 print("\n💀 Game Over!")
                 return
                 
@@ -204,26 +245,16 @@ class RiverCrossingGame:
             
             command = input("\nWhat would you like to move? ").strip().lower()
             
-            if command == 'quit':
-                print("\n👋 Thanks for playing!")
-                return
-            elif command == 'help':
-                print("\nCommands:")
-                print("- fox, chicken, grain: move with item")
-                print("- none: move farmer alone")
-                print("- hint: get a hint")
-                print("- quit: exit game")
-                continue
-            elif command == 'hint':
-                solution = self.solve()
-                if solution:
-                    next_move = solution[len(self.state.history)]
-                    print(f"\n💡 Hint: Consider moving the {next_move[0].lower()}")
+            handler = self._COMMANDS.get(command)
+            if handler:
+                if handler(self):
+                    return
                 continue
                 
             # Process move
-            item = None if command == 'none' else command.capitalize()
-            if item and item not in ['Fox', 'Chicken', 'Grain', None]:
+            # Intern input so item lookups can match keys by identity
+            item = None if command == 'none' else sys.intern(command.capitalize())
+            if item is not None and item not in _VALID_ITEMS:
                 print("\n❌ Invalid input. Type 'help' for commands.")
                 continue
                 